@@ -0,0 +1,380 @@
+"""
+WetterMail GUI
+==============
+
+This module contains the PyQt5 window for entering the settings and sending the weather report.
+It is kept apart from main.py so that PyQt5 is only imported when the GUI is started.
+
+Functions
+---------
+
+.. function:: run(api_key: str, config_path: str) -> int
+
+Classes
+-------
+
+.. class:: FetchSendTask
+
+   .. method:: run()
+
+.. class:: UserGUI
+
+   .. method:: initUI()
+
+   .. method:: setupControls(layout)
+
+   .. method:: addTemperatureSliders(layout, config_values)
+
+   .. method:: updateTemperatureLabels()
+
+   .. method:: on_submit()
+
+   .. method:: on_send_finished(success, message)
+
+"""
+
+import sys
+import http.client
+from concurrent.futures import ThreadPoolExecutor
+from PyQt5.QtWidgets import (
+    QApplication,
+    QMainWindow,
+    QLabel,
+    QLineEdit,
+    QPushButton,
+    QVBoxLayout,
+    QWidget,
+    QMessageBox,
+    QSlider,
+    QHBoxLayout,
+    QCheckBox,
+)
+from PyQt5.QtCore import Qt, QObject, QRunnable, QThreadPool, pyqtSignal
+
+from main import ConfigManager, SmtpSender, get_data, prewarm_dns, send_email
+
+# Stylesheet of the window, built once at import
+_STYLESHEET = """
+QWidget {
+    font-family: 'Arial';
+    font-size: 14px;
+    background-color: #f0f4f8;
+}
+QLabel {
+    color: #2e3440;
+    padding: 8px;
+    font-weight: bold;
+}
+QLineEdit, QSlider {
+    border: 2px solid #88c0d0;
+    border-radius: 10px;
+    padding: 8px;
+    background-color: #eceff4;
+}
+QPushButton {
+    background-color: #5e81ac;
+    color: white;
+    border-radius: 10px;
+    padding: 10px;
+    font-weight: bold;
+}
+QPushButton:hover {
+    background-color: #81a1c1;
+}
+QSlider::groove:horizontal {
+    height: 10px;
+    background: transparent;
+}
+QSlider::handle:horizontal {
+    background: qlineargradient(x1:0, y1:0, x2:1, y2:1, stop:0 #eee, stop:1 #ccc);
+    border: 1px solid #777;
+    width: 18px;
+    margin-top: -2px;
+    margin-bottom: -2px;
+    border-radius: 8px;
+}
+QSlider#coldSlider::sub-page:horizontal {
+    background: #256fff;
+}
+QSlider#coldSlider::add-page:horizontal {
+    background: #a3be8c;
+}
+QSlider#warmSlider::sub-page:horizontal {
+    background: #a3be8c;
+}
+QSlider#warmSlider::add-page:horizontal {
+    background: #f54029;
+}
+"""
+
+
+class WorkerSignals(QObject):
+    """
+    Signals of FetchSendTask, Qt delivers them in the GUI thread.
+    """
+
+    finished = pyqtSignal(bool, str)
+
+
+class FetchSendTask(QRunnable):
+    """
+    Fetches the weather data and sends the email in a QThreadPool thread.
+    """
+
+    def __init__(self, api_key, settings, sender, receiver, password):
+        """
+        Initializes the task with the input of the GUI.
+
+        :param api_key: The API key for OpenWeatherMap.
+        :param settings: The weather settings from the input fields.
+        :param sender: The email address of the sender.
+        :param receiver: The email addresses of the receivers.
+        :param password: The password of the sender.
+        """
+        super().__init__()
+        self.signals = WorkerSignals()
+        self.api_key = api_key
+        self.settings = settings
+        self.sender = sender
+        self.receiver = receiver
+        self.password = password
+
+    def run(self):
+        """
+        Runs in a worker thread and emits finished with the result.
+
+        :return: None
+        """
+        import smtplib
+
+        smtp = SmtpSender(self.sender, self.password)
+        try:
+            # Logs in to the SMTP server while the weather data is fetched
+            with ThreadPoolExecutor(max_workers=1) as executor:
+                login = executor.submit(smtp.open)
+                data = get_data(
+                    self.api_key,
+                    self.settings["latitude"],
+                    self.settings["longitude"],
+                    self.settings["language"],
+                )
+            if not data:
+                self.signals.finished.emit(
+                    False, "Fehler beim Abrufen der Wetterdaten."
+                )
+                return
+
+            try:
+                login.result()
+            except smtplib.SMTPAuthenticationError as e:
+                # Logging in again with a wrong password risks locking the account
+                print(f"Fehler bei der Anmeldung: {e}")
+                self.signals.finished.emit(
+                    False, "Anmeldung beim E-Mail-Server fehlgeschlagen."
+                )
+                return
+            except smtplib.SMTPException:
+                pass  # Other errors are retried and reported by send_email
+
+            email_sent = send_email(
+                data,
+                self.sender,
+                self.receiver,
+                self.password,
+                self.settings["cold_threshold"],
+                self.settings["warm_threshold"],
+                connection=smtp,
+            )
+        except (OSError, http.client.HTTPException) as e:  # No connection
+            print(f"Netzwerkfehler: {e}")
+            email_sent = False
+        except ValueError as e:  # Malformed response, finished must still be emitted
+            print(f"Ungültige Antwort: {e}")
+            email_sent = False
+        finally:
+            smtp.close()
+        if email_sent:
+            self.signals.finished.emit(True, "E-Mail erfolgreich gesendet!")
+        else:  # If email was not sent
+            self.signals.finished.emit(False, "Fehler beim Senden der E-Mail.")
+
+
+class UserGUI(QMainWindow):
+    """
+    Main class for the weather GUI.
+    """
+
+    # Input fields as (label, config key, hide input)
+    INPUT_FIELDS = (
+        ("Breitengrad:", "latitude", False),
+        ("Längengrad:", "longitude", False),
+        ("Sprache (de/en):", "language", False),
+        ("Absender E-Mail:", "sender_email", False),
+        ("Absender Passwort:", "decrypted_password", True),
+        ("Empfänger E-Mail:", "receiver_email", False),
+    )
+
+    def __init__(self, ConfigManager, api_key):
+        super().__init__()  # Creates object for the UI configuration
+        self.config_manager = ConfigManager
+        self.api_key = api_key
+        self.initUI()
+
+    def initUI(self):
+        """
+        Initializes the GUI window design and appearance.
+
+        :return: None
+        """
+        self.setWindowTitle("WetterMail GUI")
+        self.setGeometry(100, 100, 500, 500)
+        self.central_widget = QWidget(self)
+        self.setCentralWidget(self.central_widget)
+        layout = QVBoxLayout(self.central_widget)
+
+        self.setupControls(layout)
+        self.save_input_checkbox = QCheckBox("Eingaben Speichern", self)
+        layout.addWidget(self.save_input_checkbox)
+
+        self.send_btn = QPushButton("Senden", self)
+        self.send_btn.clicked.connect(self.on_submit)
+        layout.addWidget(self.send_btn)
+
+        self.setStyleSheet(_STYLESHEET)
+
+    def setupControls(self, layout):
+        """
+        Sets up the controls for the GUI.
+
+        :param layout: The layout to which the controls will be added.
+        :return: None
+        """
+
+        # Loads config and puts it into input fields
+        config_values = self.config_manager.load_config()
+        self.entries = {}
+
+        # creates input fields dynamicaly for each config.ini entry
+        for label_text, key, hide_text in self.INPUT_FIELDS:
+            layout.addWidget(QLabel(label_text, self))
+            entry = QLineEdit(self)
+            entry.setText(str(config_values[key]))
+            if hide_text:
+                entry.setEchoMode(QLineEdit.Password)
+            layout.addWidget(entry)
+            self.entries[key] = entry
+
+        self.addTemperatureSliders(layout, config_values)
+
+    def addTemperatureSliders(self, layout, config_values):
+        """
+        Adds two temperature sliders to the GUI.
+
+        :param layout: The layout to which the sliders will be added.
+        :param config_values: The configuration values for the sliders.
+        :return: None
+        """
+
+        self.slider_label = QLabel(
+            f"Temperatur Komfortzone: {config_values['cold_threshold']}°C - {config_values['warm_threshold']}°C",
+            self,
+        )
+        layout.addWidget(self.slider_label)
+
+        slider_container = QWidget(self)
+        slider_layout = QHBoxLayout(slider_container)
+        self.cold_slider = QSlider(Qt.Horizontal, self)
+        self.cold_slider.setObjectName("coldSlider")
+        self.cold_slider.setMinimum(0)
+        self.cold_slider.setMaximum(15)
+        self.cold_slider.setValue(config_values["cold_threshold"])
+        self.cold_slider.setTickPosition(QSlider.TicksBelow)
+        self.cold_slider.setTickInterval(1)
+        self.warm_slider = QSlider(Qt.Horizontal, self)
+        self.warm_slider.setObjectName("warmSlider")
+        self.warm_slider.setMinimum(15)
+        self.warm_slider.setMaximum(30)
+        self.warm_slider.setValue(config_values["warm_threshold"])
+        self.warm_slider.setTickPosition(QSlider.TicksBelow)
+        self.warm_slider.setTickInterval(1)
+
+        slider_layout.addWidget(self.cold_slider)
+        slider_layout.addWidget(self.warm_slider)
+        layout.addWidget(slider_container)
+
+        self.cold_slider.valueChanged.connect(self.updateTemperatureLabels)
+        self.warm_slider.valueChanged.connect(self.updateTemperatureLabels)
+
+    def updateTemperatureLabels(self):
+        self.slider_label.setText(
+            f"Temperatur Komfortzone {self.cold_slider.value()}°C - {self.warm_slider.value()}°C"
+        )
+
+    def on_submit(self):
+        settings = {
+            "latitude": self.entries["latitude"].text(),
+            "longitude": self.entries["longitude"].text(),
+            "language": self.entries["language"].text(),
+            "cold_threshold": self.cold_slider.value(),
+            "warm_threshold": self.warm_slider.value(),
+        }
+
+        # Network I/O runs in the thread pool so the window stays responsive
+        self.send_btn.setEnabled(False)
+        task = FetchSendTask(
+            self.api_key,
+            settings,
+            self.entries["sender_email"].text(),
+            [  # Several receivers are separated by commas
+                address.strip()
+                for address in self.entries["receiver_email"].text().split(",")
+                if address.strip()
+            ],
+            self.entries["decrypted_password"].text(),
+        )
+        task.signals.finished.connect(self.on_send_finished)
+        QThreadPool.globalInstance().start(task)
+
+        # Check the checkbox before saving the configuration
+        if self.save_input_checkbox.isChecked():
+            self.config_manager.save_config(
+                settings["latitude"],
+                settings["longitude"],
+                settings["language"],
+                settings["cold_threshold"],
+                settings["warm_threshold"],
+                self.entries["sender_email"].text(),
+                self.entries["receiver_email"].text(),
+                self.entries["decrypted_password"].text(),
+            )
+
+    def on_send_finished(self, success, message):
+        """
+        Shows the result of FetchSendTask, runs in the GUI thread.
+
+        :param success: True if the email was sent.
+        :param message: The message for the user.
+        :return: None
+        """
+        self.send_btn.setEnabled(True)
+        if success:
+            QMessageBox.information(self, "Erfolg", message)
+            self.close()
+        else:
+            QMessageBox.warning(self, "Fehler", message)
+
+
+def run(api_key: str, config_path: str) -> int:
+    """
+    Shows the GUI and runs the Qt event loop.
+
+    :param api_key: The API key for OpenWeatherMap.
+    :param config_path: The path to the configuration file.
+    :return: The exit code of the event loop.
+    """
+    prewarm_dns()  # Resolves the servers while the user fills in the form
+    app = QApplication(sys.argv)
+    config_manager = ConfigManager(config_path)
+    window = UserGUI(config_manager, api_key)
+    window.show()
+    return app.exec_()
@@ -4,42 +4,54 @@ Weather Report Emailer
 
 This module allows you to send weather reports via email.
 It retrieves weather data to suggest clothes based on the weather conditions at the given location.
+The PyQt5 GUI is in gui.py and is started by running this module, with --headless the
+report is sent with the saved configuration instead.
 
 Functions
 ---------
 
 .. function:: conditions(main: str) -> str
 
-.. function:: clothing(temperature: int, cold_threshold: str, warm_threshold: str) -> str
+.. function:: clothing(temperature: int, cold_threshold: int, warm_threshold: int) -> str
 
 .. function:: get_data(api_key: str, lat: str, lon: str, lang: str) -> Optional[Dict[str, Any]]
 
-.. function:: send_email(data: Dict[str, Any], sender: str, receiver: str, password: str, cold_threshold: str, warm_threshold: str) -> bool
+.. function:: get_data_batch(api_key: str, city_ids: List[int], lang: str) -> Optional[List[Dict[str, Any]]]
+
+.. function:: prewarm_dns() -> threading.Thread
+
+.. function:: run_headless(api_key: str, config_path: str) -> bool
+
+.. function:: send_bulk(data: Dict[str, Any], sender: str, receivers: List[str], password: str, cold_threshold: int, warm_threshold: int, processes: int = 4, chunk_size: int = 50) -> bool
+
+.. function:: send_email(data: Dict[str, Any], sender: str, receiver: Union[str, List[str]], password: str, cold_threshold: int, warm_threshold: int, *, connection: Optional[SmtpSender] = None, today: Optional[str] = None) -> bool
 
 Classes
 -------
 
-.. class:: ConfigManager
+.. class:: SmtpSender
 
-   .. method:: create_default_config() -> None
+   .. method:: open() -> None
 
-   .. method:: save_config(settings: Dict[str, Any], password: str, key: bytes) -> None
+   .. method:: send(receivers: List[str], message: bytes) -> Dict[str, Tuple[int, bytes]]
 
-   .. method:: load_config() -> Dict[str, Any]
+   .. method:: close() -> None
 
-   .. method:: generate_password_key() -> bytes
+.. class:: PasswordCipher
 
-.. class:: UserGUI
+   .. method:: encrypt(plaintext: str) -> str
 
-   .. method:: initUI()
+   .. method:: decrypt(token: str) -> str
 
-   .. method:: setupControls(layout)
+.. class:: ConfigManager
+
+   .. method:: create_default_config() -> None
 
-   .. method:: addTemperatureSliders(layout, config_values)
+   .. method:: save_config(settings: Dict[str, Any], password: str, key: bytes) -> None
 
-   .. method:: updateTemperatureLabels()
+   .. method:: load_config() -> Dict[str, Any]
 
-   .. method:: on_submit()
+   .. method:: generate_password_key() -> bytes
 
 Example
 -------
@@ -47,7 +59,7 @@ Example
 .. code-block:: python
 
    get_data(api_key, '1', '1', 'de')
-   send_email(weather_data, 'sender@gmail.com', 'receiver@gmail.com', 'password123', '5', '25')
+   send_email(weather_data, 'sender@gmail.com', 'receiver@gmail.com', 'password123', 5, 25)
 
 
 
@@ -56,29 +68,126 @@ Detailed Descriptions
 
 """
 
+from __future__ import annotations
+
 import os
-import smtplib
+import time
+import string
+import base64
+import secrets
+import atexit
+import hashlib
+import socket
+import functools
+import threading
 import configparser
-import requests
-from email.mime.text import MIMEText
-from email.mime.multipart import MIMEMultipart
+import http.client
+import json
+import gzip
+import re
+import email.utils
+import urllib.parse
 from datetime import datetime
-from cryptography.fernet import Fernet
-from typing import Optional, Dict, Any
-from PyQt5.QtWidgets import (
-    QApplication,
-    QMainWindow,
-    QLabel,
-    QLineEdit,
-    QPushButton,
-    QVBoxLayout,
-    QWidget,
-    QMessageBox,
-    QSlider,
-    QHBoxLayout,
-    QCheckBox,
+from typing import Optional, Dict, Any, List, Mapping, Tuple, Union, TYPE_CHECKING
+
+if TYPE_CHECKING:  # smtplib, requests and cryptography are imported on first use
+    import ssl
+    import smtplib
+    import requests
+    import diskcache
+
+try:  # Rust implementation of Fernet, noticeably faster for short tokens
+    from rfernet import Fernet as RustFernet
+except ImportError:
+    RustFernet = None
+
+try:  # Faster JSON parser, decodes the response bytes directly
+    from orjson import loads as json_loads
+except ImportError:
+    json_loads = json.loads
+
+# Additional clothing for each weather condition that needs it
+_COND_PREFIX = {
+    "Rain": "Kopfbedeckung und ",
+    "Drizzle": "Kopfbedeckung und ",
+    "Thunderstorm": "Kopfbedeckung und ",
+    "Snow": "Handschuhe, Kopfbedeckung und ",
+}
+
+# Body of the weather report email, filled in with substitute by send_email
+_HTML_TEMPLATE = string.Template(
+    """
+<html>
+    <head>
+        <style>
+            body { font-family: Arial, sans-serif; }
+            table { width: 100%; border-collapse: collapse; }
+            th, td { border: 1px solid #ddd; padding: 8px; }
+            th { background-color: #f2f2f2; }
+        </style>
+    </head>
+    <body>
+        <h2>Wetterbericht $region für den $today</h2>
+        <table>
+            <tr>
+                <th>Beschreibung</th>
+                <td>$description</td>
+            </tr>
+            <tr>
+                <th>Aktuelle Temperatur</th>
+                <td>$temp°C</td>
+            </tr>
+            <tr>
+                <th>Empfohlene Kleidung</th>
+                <td>$recommendation</td>
+            </tr>
+        </table>
+    </body>
+</html>
+"""
 )
-from PyQt5.QtCore import Qt
+
+# Today's date formatted for the report, recomputed when the date changes
+_TODAY_CACHE: Dict[str, Any] = {"date": None, "str": None}
+
+_OWM_HOST = "api.openweathermap.org"
+_OWM_URL = f"https://{_OWM_HOST}/data/2.5/weather"
+_OWM_GROUP_URL = f"https://{_OWM_HOST}/data/2.5/group"
+
+# Weather data keyed by (lat, lon, lang): (expires_at, data, validators), the
+# validators are the If-None-Match/If-Modified-Since headers to revalidate it
+_WEATHER_CACHE: Dict[
+    Tuple[str, str, str], Tuple[float, Dict[str, Any], Dict[str, str]]
+] = {}
+WEATHER_CACHE_TTL = 600  # Seconds, OpenWeatherMap's update interval
+# Keeps the weather data between runs if diskcache is installed
+WEATHER_DISK_CACHE = os.path.expanduser("~/.wettermail_cache")
+
+_HTTP_CONNECTION: Optional[http.client.HTTPSConnection] = None  # Without requests
+
+SMTP_HOST = "smtp.gmail.com"
+SMTP_PORT = 465  # SMTPS, Gmail also offers STARTTLS on 587
+
+# Logged-in SMTP connections keyed by (host, port, sender)
+_SMTP_POOL: Dict[Tuple[str, int, str], SmtpSender] = {}
+SMTP_MAX_AGE = 100  # Seconds a pooled connection is reused
+SMTP_MAX_MESSAGES = 10  # Messages sent over one connection before reconnecting
+
+# Token bucket per receiver domain: (tokens, updated_at), bursts get throttled with 421
+_RATE_BUCKETS: Dict[str, Tuple[float, float]] = {}
+_RATE_LOCK = threading.Lock()
+SMTP_RATE_LIMIT = 60  # Messages per domain ...
+SMTP_RATE_PERIOD = 60  # ... within this many seconds
+_RATE_SHARE = 1  # Number of send_bulk processes that split SMTP_RATE_LIMIT
+
+# Parsed config.ini, reused as long as the file's modification time does not change
+_CONFIG_CACHE: Dict[str, Any] = {
+    "path": None,
+    "mtime": None,
+    "parser": None,
+    "values": None,
+    "digest": None,
+}
 
 
 def conditions(main: str) -> str:
@@ -88,14 +197,10 @@ def conditions(main: str) -> str:
     :param main: The main weather condition.
     :return: Recommendations for additional clothing.
     """
-    if main in ["Rain", "Drizzle", "Thunderstorm"]:
-        return "Kopfbedeckung und "
-    elif main in ["Snow"]:
-        return "Handschuhe, Kopfbedeckung und "
-    return ""
+    return _COND_PREFIX.get(main, "")
 
 
-def clothing(temperature: int, cold_threshold: str, warm_threshold: str) -> str:
+def clothing(temperature: int, cold_threshold: int, warm_threshold: int) -> str:
     """
     Recommends clothing based on the temperature.
 
@@ -105,9 +210,9 @@ def clothing(temperature: int, cold_threshold: str, warm_threshold: str) -> str:
     :return: String to suggest clothing type like warm clothing.
     """
 
-    if temperature > int(warm_threshold):
+    if temperature > warm_threshold:
         return "luftige Kleidung"
-    elif temperature < int(cold_threshold):
+    elif temperature < cold_threshold:
         return "warme Kleidung"
     return "normale Kleidung"
 
@@ -116,6 +221,12 @@ def get_data(api_key: str, lat: str, lon: str, lang: str) -> Optional[Dict[str,
     """
     Fetches weather data from OpenWeatherMap API.
 
+    OpenWeatherMap updates its data about every 10 minutes, so responses are cached
+    per location and language for that long, unless Cache-Control or Expires say
+    otherwise. With diskcache installed the cache is also kept on disk for the next
+    run. Afterwards the cached response is revalidated with its ETag or
+    Last-Modified header.
+
     :param api_key: The API key for OpenWeatherMap.
     :param lat: The latitude of the location.
     :param lon: The longitude of the location.
@@ -123,91 +234,780 @@ def get_data(api_key: str, lat: str, lon: str, lang: str) -> Optional[Dict[str,
     :return: A dictionary with the weather data.
     """
 
-    request_url = f"https://api.openweathermap.org/data/2.5/weather?lat={lat}&lon={lon}&appid={api_key}&lang={lang}"
-    feedback = requests.get(request_url, timeout=10)
-    if feedback.status_code == 200:
-        return feedback.json()
-    return None
+    key = (lat, lon, lang)
+    cached = _WEATHER_CACHE.get(key)
+    if cached is not None and time.monotonic() < cached[0]:
+        return cached[1]
+
+    disk_cache = _get_disk_cache()
+    disk_key = f"{lat}:{lon}:{lang}"
+    if disk_cache is not None:
+        stored, expire_time = disk_cache.get(disk_key, expire_time=True)
+        if stored is not None:  # Fetched by an earlier run and still fresh
+            expires_at = time.monotonic() + expire_time - time.time()
+            _WEATHER_CACHE[key] = (expires_at, stored[0], stored[1])
+            return stored[0]
+
+    # Revalidate instead of downloading again
+    headers = dict(cached[2]) if cached is not None else {}
+    status, data, response_headers = _owm_get(
+        _OWM_URL,
+        {
+            "lat": lat,
+            "lon": lon,
+            "appid": api_key,
+            "lang": lang,
+            "units": "metric",
+        },
+        headers,
+    )
+    if status == 304 and cached is not None:  # Not modified, no body was sent
+        data = cached[1]
+        validators = {**cached[2], **_validators(response_headers)}
+    elif data is None:
+        return None
+    else:
+        validators = _validators(response_headers)
+    ttl = _cache_ttl(response_headers)
+    _WEATHER_CACHE[key] = (time.monotonic() + ttl, data, validators)
+    if disk_cache is not None and ttl > 0:
+        disk_cache.set(disk_key, (data, validators), expire=ttl)
+    return data
+
+
+def _validators(headers: Mapping[str, str]) -> Dict[str, str]:
+    """
+    Builds the conditional request headers that revalidate a cached response.
+
+    :param headers: The response headers.
+    :return: If-None-Match and If-Modified-Since for the ETag and Last-Modified headers
+        the response has.
+    """
+    validators = {}
+    if headers.get("ETag"):
+        validators["If-None-Match"] = headers["ETag"]
+    if headers.get("Last-Modified"):
+        validators["If-Modified-Since"] = headers["Last-Modified"]
+    return validators
+
+
+def _cache_ttl(headers: Mapping[str, str]) -> float:
+    """
+    Determines how long a response may be cached from its Cache-Control or Expires
+    header.
+
+    :param headers: The response headers.
+    :return: The time to live in seconds, WEATHER_CACHE_TTL if no header sets it.
+    """
+    try:
+        match = re.search(r"max-age=(\d+)", headers.get("Cache-Control") or "")
+        if match:
+            return int(match.group(1))
+        expires = headers.get("Expires")
+        if expires:
+            expires_at = email.utils.parsedate_to_datetime(expires).timestamp()
+            return max(0.0, expires_at - time.time())
+    except (TypeError, ValueError):  # Malformed header
+        pass
+    return WEATHER_CACHE_TTL
+
+
+@functools.lru_cache(maxsize=1)
+def _get_disk_cache() -> Optional[diskcache.Cache]:
+    """
+    Opens the on-disk weather cache on first use.
+
+    :return: The cache, None if diskcache is not installed.
+    """
+    try:
+        import diskcache
+    except ImportError:  # Only the in-memory cache is used
+        return None
+
+    return diskcache.Cache(WEATHER_DISK_CACHE)
+
+
+def get_data_batch(
+    api_key: str, city_ids: List[int], lang: str
+) -> Optional[List[Dict[str, Any]]]:
+    """
+    Fetches weather data for several cities with OpenWeatherMap's group endpoint.
+
+    The endpoint accepts up to 20 city IDs, so one request is made per 20 cities.
+
+    :param api_key: The API key for OpenWeatherMap.
+    :param city_ids: The OpenWeatherMap IDs of the cities.
+    :param lang: The language for the weather data.
+    :return: A list with the weather data of each city, None if a request failed.
+    """
+
+    results = []
+    for start in range(0, len(city_ids), 20):
+        chunk = city_ids[start : start + 20]
+        _, data, _ = _owm_get(
+            _OWM_GROUP_URL,
+            {
+                "id": ",".join(map(str, chunk)),
+                "appid": api_key,
+                "lang": lang,
+                "units": "metric",
+            },
+        )
+        if data is None:
+            return None
+        results.extend(data["list"])
+    return results
+
+
+@functools.lru_cache(maxsize=1)
+def _get_session() -> Optional[requests.Session]:
+    """
+    Creates the requests session on first use, it keeps the TCP/TLS connection to
+    OpenWeatherMap open between requests.
+
+    :return: The pooled session, None if requests is not installed.
+    """
+    try:
+        import requests
+        from requests.adapters import HTTPAdapter
+        from urllib3.util.retry import Retry
+    except ImportError:  # get_data falls back to http.client
+        return None
+
+    session = requests.Session()
+    session.mount(
+        "https://",
+        HTTPAdapter(  # Only OpenWeatherMap is requested, one request at a time
+            pool_connections=4,
+            pool_maxsize=4,
+            max_retries=Retry(  # Also retries OpenWeatherMap's transient 5xx replies
+                total=3,
+                backoff_factor=0.3,
+                status_forcelist=(500, 502, 503, 504),
+                raise_on_status=False,
+            ),
+        ),
+    )
+    return session
+
+
+def _owm_get(
+    url: str, params: Dict[str, Any], headers: Optional[Dict[str, str]] = None
+) -> Tuple[int, Optional[Any], Mapping[str, str]]:
+    """
+    Sends a GET request to OpenWeatherMap and decodes the JSON response.
+
+    Uses the pooled requests session, or a kept-alive http.client connection if
+    requests is not installed.
+
+    :param url: The URL of the API endpoint.
+    :param params: The query parameters.
+    :param headers: Additional request headers.
+    :return: The status code, the decoded response (None if the status code is not
+        200 or the body is not valid JSON) and the response headers.
+    """
+    session = _get_session()
+    if session is not None:
+        feedback = session.get(url, params=params, headers=headers, timeout=10)
+        if feedback.status_code == 200:
+            data = _decode_json(feedback.content)
+            return feedback.status_code, data, feedback.headers
+        return feedback.status_code, None, feedback.headers
+
+    global _HTTP_CONNECTION
+    path = f"{urllib.parse.urlsplit(url).path}?{urllib.parse.urlencode(params)}"
+    headers = {"Accept-Encoding": "gzip", **(headers or {})}  # requests does this too
+    for attempt in range(2):
+        if _HTTP_CONNECTION is None:
+            _HTTP_CONNECTION = http.client.HTTPSConnection(_OWM_HOST, timeout=10)
+        try:
+            _HTTP_CONNECTION.request("GET", path, headers=headers)
+            feedback = _HTTP_CONNECTION.getresponse()
+            body = feedback.read()
+            break
+        except (http.client.HTTPException, ConnectionError):
+            _HTTP_CONNECTION.close()  # Server closed the kept-alive connection
+            _HTTP_CONNECTION = None
+            if attempt:
+                raise
+    if feedback.status == 200:
+        if feedback.getheader("Content-Encoding") == "gzip":
+            try:
+                body = gzip.decompress(body)
+            except (OSError, EOFError):  # Broken or truncated, rejected below
+                body = b""
+        return feedback.status, _decode_json(body), feedback.headers
+    return feedback.status, None, feedback.headers
+
+
+def _decode_json(body: bytes) -> Optional[Any]:
+    """
+    Decodes a JSON response body.
+
+    :param body: The raw response body.
+    :return: The decoded response, None if the body is not valid JSON.
+    """
+    try:
+        return json_loads(body)
+    except ValueError as e:  # Truncated, or e.g. an HTML error page
+        print(f"Ungültige Antwort von OpenWeatherMap: {e}")
+        return None
+
+
+def prewarm_dns() -> threading.Thread:
+    """
+    Resolves the OpenWeatherMap and SMTP hosts in a background thread, so the
+    lookups are in the OS resolver cache when the report is sent.
+
+    :return: The started daemon thread.
+    """
+
+    def resolve() -> None:
+        for host, port in ((_OWM_HOST, 443), (SMTP_HOST, SMTP_PORT)):
+            try:
+                socket.getaddrinfo(host, port, type=socket.SOCK_STREAM)
+            except OSError:  # Offline, the real connection reports the error
+                pass
+
+    thread = threading.Thread(target=resolve, name="prewarm-dns", daemon=True)
+    thread.start()
+    return thread
+
+
+def _today_str() -> str:
+    """
+    Returns today's date formatted as dd.mm.yy, formatted once per day.
+
+    :return: The formatted date.
+    """
+    today = datetime.now().date()
+    if today != _TODAY_CACHE["date"]:
+        _TODAY_CACHE.update(date=today, str=today.strftime("%d.%m.%y"))
+    return _TODAY_CACHE["str"]
 
 
 def send_email(
     data: Dict[str, Any],
     sender: str,
-    receiver: str,
+    receiver: Union[str, List[str]],
     password: str,
-    cold_threshold: str,
-    warm_threshold: str,
+    cold_threshold: int,
+    warm_threshold: int,
+    *,
+    connection: Optional[SmtpSender] = None,
+    today: Optional[str] = None,
 ) -> bool:
     """
     Sends an email with the weather report.
 
+    Several receivers get one message each, all sent over the same connection. A
+    refused receiver is reported and the others still get the email.
+
     :param data: The stored weather data.
     :param sender: The email address of the sender.
-    :param receiver: The email address of the receiver.
+    :param receiver: The email address of the receiver, or a list of addresses.
     :param password: The password of the sender.
     :param cold_threshold: The cold threshold.
     :param warm_threshold: The warm threshold.
-    :return: True if the email was successfully sent, otherwise False.
+    :param connection: An open SmtpSender to reuse, otherwise a pooled one is used.
+    :param today: The date for the report as dd.mm.yy, defaults to today.
+    :return: True if the email was sent to every receiver, otherwise False.
     """
 
     if not data:
         return False
+    receivers = [receiver] if isinstance(receiver, str) else receiver
+    if not receivers or not all(receivers):  # Also catches an empty address
+        print("Fehler beim Senden der Mail: Keine Empfänger-Adresse angegeben.")
+        return False
 
-    region = data["name"]
-    description = data["weather"][0]["description"]
-    temp = round(data["main"]["temp"] - 273.15)
-    main = data["weather"][0]["main"]
-    today = datetime.now().strftime("%d.%m.%y")
+    try:  # e.g. {"cod": 401, "message": "Invalid API key"} instead of weather data
+        region = data["name"]
+        description = data["weather"][0]["description"]
+        temp = round(data["main"]["temp"])
+        main = data["weather"][0]["main"]
+    except (KeyError, IndexError, TypeError):
+        print(f"Ungültige Wetterdaten: {data}")
+        return False
+    if today is None:
+        today = _today_str()
     conditions_txt = conditions(main)
     clothing_txt = clothing(temp, cold_threshold, warm_threshold)
 
-    html_body = f"""
-    <html>
-        <head>
-            <style>
-                body {{ font-family: Arial, sans-serif; }}
-                table {{ width: 100%; border-collapse: collapse; }}
-                th, td {{ border: 1px solid #ddd; padding: 8px; }}
-                th {{ background-color: #f2f2f2; }}
-            </style>
-        </head>
-        <body>
-            <h2>Wetterbericht {region} für den {today}</h2>
-            <table>
-                <tr>
-                    <th>Beschreibung</th>
-                    <td>{description}</td>
-                </tr>
-                <tr>
-                    <th>Aktuelle Temperatur</th>
-                    <td>{temp}°C</td>
-                </tr>
-                <tr>
-                    <th>Empfohlene Kleidung</th>
-                    <td>{conditions_txt + clothing_txt}</td>
-                </tr>
-            </table>
-        </body>
-    </html>
-    """
-
-    msg = MIMEMultipart("alternative")  # Both Text + HTML Content combined
-    msg["From"] = sender
-    msg["To"] = receiver
-    msg["Subject"] = f"Wetterbericht für {region} am {today}"
-    msg.attach(MIMEText(html_body, "html"))
-
-    try:  # Server connection test, prints clear description of errors
-        with smtplib.SMTP("smtp.gmail.com", 587) as server:
-            server.starttls()
-            server.login(sender, password)
-            server.sendmail(sender, receiver, msg.as_string())
-        return True
-    except smtplib.SMTPException as e:
+    html_body = _HTML_TEMPLATE.substitute(
+        region=region,
+        today=today,
+        description=description,
+        temp=temp,
+        recommendation=conditions_txt + clothing_txt,
+    )
+
+    import smtplib
+    from email.header import Header
+
+    # Single HTML part, so the message is assembled without the email package
+    subject = Header(f"Wetterbericht für {region} am {today}", "utf-8")
+    subject = subject.encode(linesep="\r\n")  # RFC 2047, as the subject is not ASCII
+    # Everything after the To header is the same for every receiver
+    rest = (
+        f"Subject: {subject}\r\n"
+        "MIME-Version: 1.0\r\n"
+        "Content-Type: text/html; charset=utf-8\r\n"
+        "Content-Transfer-Encoding: 8bit\r\n"
+        "\r\n" + html_body.replace("\n", "\r\n")
+    ).encode("utf-8")
+
+    results = []
+    for address in receivers:
+        msg = f"From: {sender}\r\nTo: {address}\r\n".encode("utf-8") + rest
+        _take_token(address.rpartition("@")[2].lower())
+        try:  # Server connection test, prints clear description of errors
+            _send_with_retry(connection, sender, password, address, msg)
+            results.append(True)
+        except smtplib.SMTPException as e:  # Keeps sending to the other receivers
+            print(f"Fehler beim Senden der Mail an {address}: {e}")
+            results.append(False)
+            connection_errors = (
+                smtplib.SMTPServerDisconnected,
+                smtplib.SMTPAuthenticationError,
+                smtplib.SMTPConnectError,
+            )
+            # Only a failed connection is dropped from the pool, not a refused address
+            if isinstance(e, connection_errors) or getattr(e, "smtp_code", 0) == 421:
+                if connection is None:
+                    _close_smtp((SMTP_HOST, SMTP_PORT, sender))
+                if isinstance(e, smtplib.SMTPAuthenticationError):
+                    break  # Logging in again with the same password fails as well
+    return all(results)
+
+
+def _send_with_retry(
+    connection: Optional[SmtpSender],
+    sender: str,
+    password: str,
+    address: str,
+    msg: bytes,
+) -> None:
+    """
+    Sends a message to one receiver, retrying once after a timed out connection or a
+    temporary 4xx reply.
+
+    :param connection: An open SmtpSender to reuse, otherwise a pooled one is used.
+    :param sender: The email address of the sender.
+    :param password: The password of the sender.
+    :param address: The email address of the receiver.
+    :param msg: The complete message including headers.
+    :raises smtplib.SMTPException: If the message could not be sent.
+    :return: None
+    """
+    import smtplib
+
+    for attempt in range(2):
+        smtp = connection if connection is not None else _get_smtp(sender, password)
+        try:
+            smtp.send([address], msg)
+            return
+        except smtplib.SMTPServerDisconnected:
+            smtp.close()  # Connection timed out, reconnect once
+            if attempt:
+                raise
+        except (smtplib.SMTPResponseException, smtplib.SMTPRecipientsRefused) as e:
+            if isinstance(e, smtplib.SMTPRecipientsRefused):
+                codes = [code for code, _ in e.recipients.values()]
+            else:
+                codes = [e.smtp_code]
+            if 421 in codes:  # Server closes the connection, reconnect
+                smtp.close()
+            # Temporary 4xx failure, retry once
+            if attempt or not all(400 <= code < 500 for code in codes):
+                raise
+
+
+class SmtpSender:
+    """
+    A logged-in SMTP connection that sends one or more messages.
+
+    Used as context manager, a batch of emails costs one TLS handshake and login.
+    """
+
+    def __init__(
+        self, sender: str, password: str, host: str = SMTP_HOST, port: int = SMTP_PORT
+    ):
+        """
+        Initializes the sender without connecting yet.
+
+        :param sender: The email address of the sender.
+        :param password: The password of the sender.
+        :param host: The SMTP server.
+        :param port: The SMTP port, TLS is used from the start (implicit TLS).
+        """
+        self.sender = sender
+        self.password = password
+        self.host = host
+        self.port = port
+        self.server: Optional[smtplib.SMTP] = None
+        self.opened_at = 0.0
+        self.sent = 0
+
+    def __enter__(self) -> SmtpSender:
+        self.open()
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
+    def open(self) -> None:
+        """
+        Connects to the server over TLS and logs in.
+
+        :return: None
+        """
+        import smtplib
+
+        self.close()
+        # Implicit TLS saves the EHLO/STARTTLS round-trip before the handshake
+        server = smtplib.SMTP_SSL(self.host, self.port, context=_ssl_context())
+        try:
+            server.login(self.sender, self.password)
+        except smtplib.SMTPException:
+            server.close()
+            raise
+        self.server = server
+        self.opened_at = time.monotonic()
+        self.sent = 0
+
+    def is_fresh(self) -> bool:
+        """
+        Checks whether the connection is open and young enough to be reused.
+
+        :return: True if the connection can be reused, otherwise False.
+        """
+        return (
+            self.server is not None
+            and time.monotonic() - self.opened_at < SMTP_MAX_AGE
+            and self.sent < SMTP_MAX_MESSAGES
+        )
+
+    def send(
+        self, receivers: List[str], message: bytes
+    ) -> Dict[str, Tuple[int, bytes]]:
+        """
+        Sends a message, connecting first if necessary.
+
+        :param receivers: The email addresses of the receivers.
+        :param message: The complete message including headers.
+        :return: The refused receivers, like smtplib's sendmail.
+        """
+        if self.server is None:
+            self.open()
+        refused = _pipelined_sendmail(self.server, self.sender, receivers, message)
+        self.sent += 1
+        return refused
+
+    def close(self) -> None:
+        """
+        Logs out and closes the connection.
+
+        :return: None
+        """
+        import smtplib
+
+        if self.server is None:
+            return
+        try:
+            self.server.quit()
+        except (smtplib.SMTPException, OSError):  # Connection is already gone
+            self.server.close()
+        self.server = None
+
+
+@functools.lru_cache(maxsize=1)
+def _ssl_context() -> ssl.SSLContext:
+    """
+    Creates the TLS context for SMTP once, loading the CA certificates is not free.
+
+    :return: The default SSL context.
+    """
+    import ssl
+
+    return ssl.create_default_context()
+
+
+def _take_token(domain: str) -> None:
+    """
+    Waits until another message may be sent to the domain, using a token bucket of
+    SMTP_RATE_LIMIT messages per SMTP_RATE_PERIOD seconds. The buckets are per
+    process, so each send_bulk worker only gets its share of the limit.
+
+    :param domain: The domain of the receiver.
+    :return: None
+    """
+    limit = SMTP_RATE_LIMIT / _RATE_SHARE
+    rate = limit / SMTP_RATE_PERIOD
+    with _RATE_LOCK:
+        now = time.monotonic()
+        tokens, updated_at = _RATE_BUCKETS.get(domain, (limit, now))
+        tokens = min(limit, tokens + (now - updated_at) * rate)
+        wait = max(0.0, (1 - tokens) / rate)
+        # Reserves the token, later callers wait behind this one
+        _RATE_BUCKETS[domain] = (tokens + wait * rate - 1, now + wait)
+    if wait:
+        time.sleep(wait)
+
+
+def _get_smtp(sender: str, password: str) -> SmtpSender:
+    """
+    Returns a logged-in SmtpSender, reusing a pooled one if it is still fresh.
+
+    :param sender: The email address of the sender.
+    :param password: The password of the sender.
+    :return: The logged-in SmtpSender.
+    """
+    key = (SMTP_HOST, SMTP_PORT, sender)
+    connection = _SMTP_POOL.get(key)
+    if connection is None or connection.password != password:
+        _close_smtp(key)
+        connection = _SMTP_POOL[key] = SmtpSender(sender, password)
+    if not connection.is_fresh():
+        connection.open()
+    return connection
+
+
+def _pipelined_sendmail(
+    server: smtplib.SMTP, sender: str, receivers: List[str], message: bytes
+) -> Dict[str, Tuple[int, bytes]]:
+    """
+    Sends a message with SMTP pipelining (RFC 2920) if the server supports it.
+
+    MAIL FROM and all RCPT TO commands are written at once and their replies are read
+    afterwards, which saves a round-trip per command. Falls back to sendmail otherwise.
+    The body is 8bit, so BODY=8BITMIME (RFC 6152) is declared if the server offers it.
+
+    :param server: The logged-in SMTP connection.
+    :param sender: The email address of the sender.
+    :param receivers: The email addresses of the receivers.
+    :param message: The complete message including headers.
+    :return: The refused receivers, like smtplib's sendmail.
+    """
+    import smtplib
+
+    mail_options = ["BODY=8BITMIME"] if "8bitmime" in server.esmtp_features else []
+    if "pipelining" not in server.esmtp_features:
+        return server.sendmail(sender, receivers, message, mail_options)
+
+    commands = [" ".join([f"mail FROM:{smtplib.quoteaddr(sender)}", *mail_options])]
+    commands += [f"rcpt TO:{smtplib.quoteaddr(receiver)}" for receiver in receivers]
+    server.send("".join(f"{command}\r\n" for command in commands))
+    replies = [server.getreply() for _ in commands]  # Read every reply, in order
+
+    code, resp = replies[0]
+    if code != 250:
+        server.rset()
+        raise smtplib.SMTPSenderRefused(code, resp, sender)
+    refused = {
+        receiver: reply
+        for receiver, reply in zip(receivers, replies[1:])
+        if reply[0] not in (250, 251)
+    }
+    if len(refused) == len(receivers):
+        server.rset()
+        raise smtplib.SMTPRecipientsRefused(refused)
+    code, resp = server.data(message)
+    if code != 250:
+        server.rset()
+        raise smtplib.SMTPDataError(code, resp)
+    return refused
+
+
+def _close_smtp(key: Tuple[str, int, str]) -> None:
+    """
+    Removes a connection from the SMTP pool and closes it.
+
+    :param key: The (host, port, sender) key of the connection.
+    :return: None
+    """
+    connection = _SMTP_POOL.pop(key, None)
+    if connection is not None:
+        connection.close()
+
+
+@atexit.register
+def _close_all_smtp() -> None:
+    """
+    Closes all pooled SMTP connections when the program exits.
+
+    :return: None
+    """
+    for key in list(_SMTP_POOL):
+        _close_smtp(key)
+
+
+def send_bulk(
+    data: Dict[str, Any],
+    sender: str,
+    receivers: List[str],
+    password: str,
+    cold_threshold: int,
+    warm_threshold: int,
+    processes: int = 4,
+    chunk_size: int = 50,
+) -> bool:
+    """
+    Sends the weather report to many receivers from several processes.
+
+    The receivers are split into chunks and each chunk is sent by a worker process
+    over its own SMTP connection, renewed every SMTP_MAX_MESSAGES messages. A single
+    chunk is sent without starting processes.
+
+    :param data: The stored weather data.
+    :param sender: The email address of the sender.
+    :param receivers: The email addresses of the receivers.
+    :param password: The password of the sender.
+    :param cold_threshold: The cold threshold.
+    :param warm_threshold: The warm threshold.
+    :param processes: The maximum number of worker processes.
+    :param chunk_size: The number of receivers per connection.
+    :return: True if the email was sent to every receiver, otherwise False.
+    """
+    if not receivers:
+        print("Fehler beim Senden der Mail: Keine Empfänger-Adresse angegeben.")
+        return False
+
+    today = _today_str()  # Same date in every process
+    chunks = [
+        (
+            data,
+            sender,
+            receivers[start : start + chunk_size],
+            password,
+            cold_threshold,
+            warm_threshold,
+            today,
+        )
+        for start in range(0, len(receivers), chunk_size)
+    ]
+    if len(chunks) <= 1:  # Starting processes would cost more than it saves
+        return all(map(_send_chunk, chunks))
+
+    import multiprocessing
+
+    workers = min(processes, len(chunks))
+    with multiprocessing.Pool(
+        workers, initializer=_init_bulk_worker, initargs=(workers,)
+    ) as pool:
+        return all(pool.map(_send_chunk, chunks))
+
+
+def _init_bulk_worker(share: int) -> None:
+    """
+    Splits the rate limit between the worker processes of send_bulk, together they
+    stay within SMTP_RATE_LIMIT per domain.
+
+    :param share: The number of worker processes.
+    :return: None
+    """
+    global _RATE_SHARE
+    _RATE_SHARE = share
+
+
+def _send_chunk(chunk: Tuple[Any, ...]) -> bool:
+    """
+    Sends the report to a chunk of receivers over a new connection, runs in a worker
+    process of send_bulk.
+
+    :param chunk: The arguments of send_email and the formatted date.
+    :return: True if the email was sent to every receiver of the chunk, otherwise False.
+    """
+    import smtplib
+
+    data, sender, receivers, password, cold_threshold, warm_threshold, today = chunk
+    results = []
+    try:
+        with SmtpSender(sender, password) as connection:
+            for start in range(0, len(receivers), SMTP_MAX_MESSAGES):
+                if start:  # Same limit per connection as the pool
+                    connection.open()
+                results.append(
+                    send_email(
+                        data,
+                        sender,
+                        receivers[start : start + SMTP_MAX_MESSAGES],
+                        password,
+                        cold_threshold,
+                        warm_threshold,
+                        connection=connection,
+                        today=today,
+                    )
+                )
+        return all(results)
+    except (smtplib.SMTPException, OSError) as e:  # Login failed
         print(f"Fehler beim Senden der Mail: {e}")
         return False
 
 
+class PasswordCipher:
+    """
+    Encrypts and decrypts the email password with a Fernet key.
+
+    Uses the rfernet package if it is installed, otherwise cryptography. Both produce the same tokens.
+    """
+
+    def __init__(self, key: bytes):
+        """
+        Initializes the cipher with a Fernet key.
+
+        :param key: The url-safe base64 encoded Fernet key.
+        :raises ValueError: If the key is not a valid Fernet key.
+        """
+        if RustFernet is not None:
+            self.fernet = RustFernet(key.decode() if isinstance(key, bytes) else key)
+        else:
+            from cryptography.fernet import Fernet
+
+            self.fernet = Fernet(key)
+
+    def encrypt(self, plaintext: str) -> str:
+        """
+        Encrypts a string.
+
+        :param plaintext: The string to encrypt.
+        :return: The Fernet token as string.
+        """
+        token = self.fernet.encrypt(plaintext.encode())  # rfernet returns str
+        return token if isinstance(token, str) else token.decode()
+
+    def decrypt(self, token: str) -> str:
+        """
+        Decrypts a Fernet token.
+
+        :param token: The Fernet token as string.
+        :return: The decrypted string.
+        """
+        return self.fernet.decrypt(token).decode()
+
+
+def _config_digest(values: Dict[str, Any]) -> bytes:
+    """
+    Hashes the configuration values to detect whether they have changed.
+
+    :param values: The configuration values as returned by load_config.
+    :return: The BLAKE2b digest of the values.
+    """
+    fields = "\0".join(f"{key}={values[key]}" for key in sorted(values))
+    return hashlib.blake2b(fields.encode()).digest()
+
+
+@functools.lru_cache(maxsize=1)
+def _get_cipher(key: bytes) -> PasswordCipher:
+    """
+    Returns the PasswordCipher for a key, built only once while the key stays the same.
+
+    :param key: The url-safe base64 encoded Fernet key.
+    :return: The cipher for the key.
+    """
+    return PasswordCipher(key)
+
+
 class ConfigManager:
     """
     Manages reading and writing to the configuration file and handling encryption.
@@ -221,9 +1021,12 @@ class ConfigManager:
         """
         self.config_path = config_path
         self.config = configparser.ConfigParser()
+        self.read_mtime: Optional[int] = None  # File version self.config holds
         if not os.path.exists(self.config_path):
             self.create_default_config()
+        self.refresh_config(self.config_mtime())  # Parse the file once at the start
         self.key = self.generate_password_key()  # Load or generate the key at the start
+        self.cipher = _get_cipher(self.key)
 
     def generate_password_key(self) -> bytes:
         """
@@ -236,11 +1039,15 @@ class ConfigManager:
                 "passwordKey.txt", "rb"
             ) as file:  # Ensure this is 'rb' for binary read
                 key = file.read()
-                Fernet(key)  # Is the key valid?
+                # A Fernet key is 32 url-safe base64 encoded bytes, checked without a
+                # cipher. validate=True rejects stray characters a cipher would refuse
+                if len(base64.b64decode(key, altchars=b"-_", validate=True)) != 32:
+                    raise ValueError("Fernet key must be 32 bytes")
                 return key  # Return Key as bytes
         except (FileNotFoundError, ValueError):
             # If the key file is missing or the key is invalid, generate new key
-            key = Fernet.generate_key()
+            key = base64.urlsafe_b64encode(secrets.token_bytes(32))  # Fernet key format
+            _get_cipher.cache_clear()  # Drop the cipher of the old key
             with open("passwordKey.txt", "wb") as file:  # wb = write-binary
                 file.write(key)
                 self.create_default_config()
@@ -265,25 +1072,51 @@ class ConfigManager:
         }
         with open(self.config_path, "w", encoding="utf-8") as configfile:
             self.config.write(configfile)
+        self.read_mtime = self.config_mtime()
+        _CONFIG_CACHE["mtime"] = None  # Next load_config uses the new file
 
-    def load_config(self) -> Dict[str, Any]:
+    def config_mtime(self) -> Optional[int]:
         """
-        Load configuration from the config.ini file.
+        Returns the modification time of the config file.
 
-        :return: Returns a dictionary containing the loaded configuration values.
+        :return: The modification time in nanoseconds, None if the file does not exist.
         """
-        self.config.read(self.config_path)
-        cipher = Fernet(self.key)
-        encrypted_password = self.config.get("EMAIL", "encrypted_password")
         try:
-            decrypted_password = (  # string into bytes, decrypt bytes back into string
-                cipher.decrypt(encrypted_password.encode()).decode()
-                if encrypted_password
-                else ""
-            )
-        except Exception as e:
-            print(f"Error decrypting password: {e}")
-            decrypted_password = ""
+            return os.stat(self.config_path).st_mtime_ns
+        except FileNotFoundError:
+            return None
+
+    def refresh_config(self, mtime: Optional[int]) -> None:
+        """
+        Reads the config file again if it has changed since it was last read.
+
+        :param mtime: The current modification time of the config file.
+        :return: None
+        """
+        if mtime != self.read_mtime:
+            self.config.read(self.config_path)
+            self.read_mtime = mtime
+
+    def cache_is_valid(self, mtime: Optional[int]) -> bool:
+        """
+        Checks whether the cached configuration belongs to the current config file.
+
+        :param mtime: The current modification time of the config file.
+        :return: True if the cache can be used, otherwise False.
+        """
+        return (
+            mtime is not None
+            and _CONFIG_CACHE["path"] == self.config_path
+            and _CONFIG_CACHE["mtime"] == mtime
+        )
+
+    def config_values(self, decrypted_password: str) -> Dict[str, Any]:
+        """
+        Collects the configuration values from the parsed config file.
+
+        :param decrypted_password: The already decrypted email password.
+        :return: Returns a dictionary containing the configuration values.
+        """
         return {
             "latitude": self.config.get("WEATHER", "latitude"),
             "longitude": self.config.get("WEATHER", "longitude"),
@@ -295,6 +1128,37 @@ class ConfigManager:
             "decrypted_password": decrypted_password,
         }
 
+    def load_config(self) -> Dict[str, Any]:
+        """
+        Load configuration from the config.ini file.
+
+        The parsed values are cached and only read again once the file has been modified.
+
+        :return: Returns a dictionary containing the loaded configuration values.
+        """
+        mtime = self.config_mtime()
+        if self.cache_is_valid(mtime) and _CONFIG_CACHE["values"] is not None:
+            return dict(_CONFIG_CACHE["values"])
+
+        self.refresh_config(mtime)
+        encrypted_password = self.config.get("EMAIL", "encrypted_password")
+        try:
+            decrypted_password = (
+                self.cipher.decrypt(encrypted_password) if encrypted_password else ""
+            )
+        except Exception as e:
+            print(f"Error decrypting password: {e}")
+            decrypted_password = ""
+        values = self.config_values(decrypted_password)
+        _CONFIG_CACHE.update(
+            path=self.config_path,
+            mtime=mtime,
+            parser=self.config,
+            values=values,
+            digest=_config_digest(values),
+        )
+        return dict(values)
+
     def save_config(
         self,
         latitude,
@@ -309,6 +1173,8 @@ class ConfigManager:
         """
         Save the current configuration to the config.ini file.
 
+        Nothing is encrypted or written if the values match the cached configuration.
+
         :param latitude: Latitude for weather data.
         :param longitude: Longitude for weather data.
         :param language: Language for weather data.
@@ -320,243 +1186,109 @@ class ConfigManager:
         :return: None
 
         """
-        self.config.read(self.config_path)
+        values = {
+            "latitude": latitude,
+            "longitude": longitude,
+            "language": language,
+            "cold_threshold": int(cold_threshold),
+            "warm_threshold": int(warm_threshold),
+            "sender_email": sender_email,
+            "receiver_email": receiver_email,
+            "decrypted_password": password,
+        }
+        digest = _config_digest(values)
+        mtime = self.config_mtime()
+        if self.cache_is_valid(mtime):  # Reuse the parsed file
+            if _CONFIG_CACHE["digest"] == digest:
+                return  # Nothing changed, skip encrypting and writing
+            self.config = _CONFIG_CACHE["parser"]
+            self.read_mtime = mtime
+        else:
+            self.refresh_config(mtime)  # Only reads if changed on disk
 
         # Set new values in the config
         self.config.set("WEATHER", "latitude", latitude)
         self.config.set("WEATHER", "longitude", longitude)
         self.config.set("WEATHER", "language", language)
-        self.config.set("WEATHER", "cold_threshold", cold_threshold)
-        self.config.set("WEATHER", "warm_threshold", warm_threshold)
+        self.config.set("WEATHER", "cold_threshold", str(cold_threshold))
+        self.config.set("WEATHER", "warm_threshold", str(warm_threshold))
         self.config.set("EMAIL", "sender_email", sender_email)
         self.config.set("EMAIL", "receiver_email", receiver_email)
 
         # Encrypt and set the password
-        cipher = Fernet(self.key)
-        encrypted_password = cipher.encrypt(password.encode()).decode()
+        encrypted_password = self.cipher.encrypt(password)
         self.config.set("EMAIL", "encrypted_password", encrypted_password)
 
         # Write the updated configuration back to file
         with open(self.config_path, "w", encoding="utf-8") as configfile:
             self.config.write(configfile)
 
-
-class UserGUI(QMainWindow):
-    """
-    Main class for the weather GUI.
-    """
-
-    def __init__(self, ConfigManager):
-        super().__init__()  # Creates object for the UI configuration
-        self.config_manager = ConfigManager
-        self.initUI()
-
-    def initUI(self):
-        """
-        Initializes the GUI window design and appearance.
-
-        :return: None
-        """
-        self.setWindowTitle("WetterMail GUI")
-        self.setGeometry(100, 100, 500, 500)
-        self.central_widget = QWidget(self)
-        self.setCentralWidget(self.central_widget)
-        layout = QVBoxLayout(self.central_widget)
-
-        self.setupControls(layout)
-        self.save_input_checkbox = QCheckBox("Eingaben Speichern", self)
-        layout.addWidget(self.save_input_checkbox)
-
-        send_btn = QPushButton("Senden", self)
-        send_btn.clicked.connect(self.on_submit)
-        layout.addWidget(send_btn)
-
-        self.setStyleSheet(
-            """
-            QWidget {
-                font-family: 'Arial';
-                font-size: 14px;
-                background-color: #f0f4f8;
-            }
-            QLabel {
-                color: #2e3440;
-                padding: 8px;
-                font-weight: bold;
-            }
-            QLineEdit, QSlider {
-                border: 2px solid #88c0d0;
-                border-radius: 10px;
-                padding: 8px;
-                background-color: #eceff4;
-            }
-            QPushButton {
-                background-color: #5e81ac;
-                color: white;
-                border-radius: 10px;
-                padding: 10px;
-                font-weight: bold;
-            }
-            QPushButton:hover {
-                background-color: #81a1c1;
-            }
-            QSlider::groove:horizontal {
-                height: 10px;
-                background: transparent;
-            }
-            QSlider::handle:horizontal {
-                background: qlineargradient(x1:0, y1:0, x2:1, y2:1, stop:0 #eee, stop:1 #ccc);
-                border: 1px solid #777;
-                width: 18px;
-                margin-top: -2px;
-                margin-bottom: -2px;
-                border-radius: 8px;
-            }
-            QSlider#coldSlider::sub-page:horizontal {
-                background: #256fff;
-            }
-            QSlider#coldSlider::add-page:horizontal {
-                background: #a3be8c;
-            }
-            QSlider#warmSlider::sub-page:horizontal {
-                background: #a3be8c; 
-            }
-            QSlider#warmSlider::add-page:horizontal {
-                background: #f54029;
-            }
-            """
+        # The written file matches the parser, so the cache stays valid
+        self.read_mtime = self.config_mtime()
+        _CONFIG_CACHE.update(
+            path=self.config_path,
+            mtime=self.read_mtime,
+            parser=self.config,
+            values=values,
+            digest=digest,
         )
 
-    def setupControls(self, layout):
-        """
-        Sets up the controls for the GUI.
-
-        :param layout: The layout to which the controls will be added.
-        :return: None
-        """
 
-        # Loads config and puts it into input fields
-        config_values = self.config_manager.load_config()
-        self.entries = {}
-        labels = [
-            ("Breitengrad:", "latitude", False),
-            ("Längengrad:", "longitude", False),
-            ("Sprache (de/en):", "language", False),
-            ("Absender E-Mail:", "sender_email", False),
-            ("Absender Passwort:", "decrypted_password", True),
-            ("Empfänger E-Mail:", "receiver_email", False),
-        ]
-
-        # creates input fields dynamicaly for each config.ini entry
-        for label_text, key, hide_text in labels:
-            label = QLabel(label_text, self)
-            layout.addWidget(label)
-            entry = QLineEdit(self)
-            entry.setText(str(config_values[key]))
-            if hide_text:
-                entry.setEchoMode(QLineEdit.Password)
-            layout.addWidget(entry)
-            self.entries[key] = entry
-
-        self.addTemperatureSliders(layout, config_values)
-
-    def addTemperatureSliders(self, layout, config_values):
-        """
-        Adds two temperature sliders to the GUI.
-
-        :param layout: The layout to which the sliders will be added.
-        :param config_values: The configuration values for the sliders.
-        :return: None
-        """
-
-        self.slider_label = QLabel(
-            f"Temperatur Komfortzone: {config_values['cold_threshold']}°C - {config_values['warm_threshold']}°C",
-            self,
-        )
-        layout.addWidget(self.slider_label)
-
-        slider_container = QWidget(self)
-        slider_layout = QHBoxLayout(slider_container)
-        self.cold_slider = QSlider(Qt.Horizontal, self)
-        self.cold_slider.setObjectName("coldSlider")
-        self.cold_slider.setMinimum(0)
-        self.cold_slider.setMaximum(15)
-        self.cold_slider.setValue(int(config_values["cold_threshold"]))
-        self.cold_slider.setTickPosition(QSlider.TicksBelow)
-        self.cold_slider.setTickInterval(1)
-        self.warm_slider = QSlider(Qt.Horizontal, self)
-        self.warm_slider.setObjectName("warmSlider")
-        self.warm_slider.setMinimum(15)
-        self.warm_slider.setMaximum(30)
-        self.warm_slider.setValue(int(config_values["warm_threshold"]))
-        self.warm_slider.setTickPosition(QSlider.TicksBelow)
-        self.warm_slider.setTickInterval(1)
-
-        slider_layout.addWidget(self.cold_slider)
-        slider_layout.addWidget(self.warm_slider)
-        layout.addWidget(slider_container)
-
-        self.cold_slider.valueChanged.connect(self.updateTemperatureLabels)
-        self.warm_slider.valueChanged.connect(self.updateTemperatureLabels)
-
-    def updateTemperatureLabels(self):
-        self.slider_label.setText(
-            f"Temperatur Komfortzone {self.cold_slider.value()}°C - {self.warm_slider.value()}°C"
-        )
+def run_headless(api_key: str, config_path: str) -> bool:
+    """
+    Sends the weather report with the saved configuration, without the GUI.
 
-    def on_submit(self):
-        settings = {
-            "latitude": self.entries["latitude"].text(),
-            "longitude": self.entries["longitude"].text(),
-            "language": self.entries["language"].text(),
-            "cold_threshold": str(self.cold_slider.value()),
-            "warm_threshold": str(self.warm_slider.value()),
-        }
+    Meant for scheduled runs, e.g. with cron. Several receivers in config.ini are
+    separated by commas.
 
+    :param api_key: The API key for OpenWeatherMap.
+    :param config_path: The path to the configuration file.
+    :return: True if the email was sent, otherwise False.
+    """
+    config_values = ConfigManager(config_path).load_config()
+    receivers = [
+        address.strip()
+        for address in config_values["receiver_email"].split(",")
+        if address.strip()
+    ]
+    try:
         data = get_data(
-            API_KEY, settings["latitude"], settings["longitude"], settings["language"]
+            api_key,
+            config_values["latitude"],
+            config_values["longitude"],
+            config_values["language"],
         )
-
-        if data:
-            email_sent = send_email(
-                data,
-                self.entries["sender_email"].text(),
-                self.entries["receiver_email"].text(),
-                self.entries["decrypted_password"].text(),
-                settings["cold_threshold"],
-                settings["warm_threshold"],
-            )
-            if email_sent:
-                QMessageBox.information(self, "Erfolg", "E-Mail erfolgreich gesendet!")
-                self.close()
-            else:  # If email was not sent
-                QMessageBox.warning(self, "Fehler", "Fehler beim Senden der E-Mail.")
-
-        else:  # If data is None
-            QMessageBox.warning(self, "Fehler", "Fehler beim Abrufen der Wetterdaten.")
-
-        # Check the checkbox before saving the configuration
-        if self.save_input_checkbox.isChecked():
-            self.config_manager.save_config(
-                settings["latitude"],
-                settings["longitude"],
-                settings["language"],
-                settings["cold_threshold"],
-                settings["warm_threshold"],
-                self.entries["sender_email"].text(),
-                self.entries["receiver_email"].text(),
-                self.entries["decrypted_password"].text(),
-            )
+        if not data:
+            print("Fehler beim Abrufen der Wetterdaten.")
+            return False
+
+        return send_email(
+            data,
+            config_values["sender_email"],
+            receivers,
+            config_values["decrypted_password"],
+            config_values["cold_threshold"],
+            config_values["warm_threshold"],
+        )
+    except (OSError, http.client.HTTPException) as e:  # No connection
+        print(f"Netzwerkfehler: {e}")
+        return False
+    except ValueError as e:  # Malformed response
+        print(f"Ungültige Antwort: {e}")
+        return False
 
 
 if __name__ == "__main__":
     import sys
 
-    app = QApplication(sys.argv)
     API_KEY = "xxxx"
-    config_manager = ConfigManager("config.ini")
-    email_settings = config_manager.load_config()
 
-    # Initialize GUI with the configuration manager and the API key
-    gui = UserGUI(config_manager)
-    gui.show()
-    sys.exit(app.exec_())
+    if "--headless" in sys.argv[1:]:  # Skips importing PyQt5 entirely
+        sys.exit(0 if run_headless(API_KEY, "config.ini") else 1)
+
+    # gui.py imports main, this makes it reuse this module instead of running it again
+    sys.modules.setdefault("main", sys.modules[__name__])
+    import gui  # PyQt5 is only imported when the GUI is started
+
+    # Initialize GUI with the configuration file and the API key
+    sys.exit(gui.run(API_KEY, "config.ini"))
@@ -2,13 +2,33 @@
 This module tests the functionality of each main.py component by using unittest
 """
 
+import os
+import gzip
+import time
 import main
+import email
+import email.policy
+import smtplib
+import tempfile
 import unittest
-from unittest.mock import patch, mock_open
+from unittest.mock import patch, mock_open, MagicMock, ANY
 from cryptography.fernet import Fernet
 
 
 class test_functionality(unittest.TestCase):
+    def setUp(self):
+        main._SMTP_POOL.clear()  # Connections must not leak between tests
+        main._WEATHER_CACHE.clear()
+        main._RATE_BUCKETS.clear()
+        disk_cache = patch("main._get_disk_cache", return_value=None)  # Keep ~ clean
+        disk_cache.start()
+        self.addCleanup(disk_cache.stop)
+        self.data = {  # Weather data as returned by OpenWeatherMap
+            "name": "Region",
+            "weather": [{"main": "Clear", "description": "clear sky"}],
+            "main": {"temp": 25},
+        }
+
     def test_conditions_rain(self):
         """Test conditions function for rainy weather."""
         self.assertEqual(main.conditions("Rain"), "Kopfbedeckung und ") # Does it return "Kopfbedeckung und" when it rains?
@@ -21,27 +41,476 @@ class test_functionality(unittest.TestCase):
         """Test clothing function for warm temperatures."""
         self.assertEqual(main.clothing(25, 5, 20), "luftige Kleidung")
 
-    @patch("requests.get")
-    def test_get_data_successful(self, mock_get):
+    @patch("main._get_session")
+    def test_get_data_successful(self, mock_session):
         """Test get_data function with a successful API call."""
+        mock_get = mock_session.return_value.get
+        mock_get.return_value.status_code = 200
+        mock_get.return_value.content = b'{"test": "data"}'
+        self.assertEqual(
+            main.get_data("test_api_key", "lat", "lon", "de"), {"test": "data"}
+        )
+        self.assertEqual(mock_get.call_args.kwargs["params"]["lang"], "de")
+
+    @patch("main._get_session")
+    def test_get_data_invalid_json(self, mock_session):
+        """Test whether get_data returns None for a body that is not valid JSON."""
+        mock_get = mock_session.return_value.get
+        mock_get.return_value.status_code = 200
+        mock_get.return_value.content = b'{"test": "da'
+        with patch("builtins.print"):
+            self.assertIsNone(main.get_data("test_api_key", "lat", "lon", "de"))
+        self.assertEqual(main._WEATHER_CACHE, {})
+
+    @patch("main._get_session")
+    def test_get_data_cached(self, mock_session):
+        """Test whether get_data reuses a recent response for the same location."""
+        mock_get = mock_session.return_value.get
+        mock_get.return_value.status_code = 200
+        mock_get.return_value.content = b'{"test": "data"}'
+        main.get_data("test_api_key", "lat", "lon", "de")
+        self.assertEqual(
+            main.get_data("test_api_key", "lat", "lon", "de"), {"test": "data"}
+        )
+        self.assertEqual(mock_get.call_count, 1)
+
+    @patch("main._get_session")
+    def test_get_data_not_modified(self, mock_session):
+        """Test whether get_data revalidates an expired response with If-Modified-Since."""
+        last_modified = "Wed, 14 Oct 2026 10:00:00 GMT"
+        expired = time.monotonic() - 1
+        main._WEATHER_CACHE[("lat", "lon", "de")] = (
+            expired,
+            {"test": "data"},
+            {"If-Modified-Since": last_modified},
+        )
+        mock_get = mock_session.return_value.get
+        mock_get.return_value.status_code = 304
+        mock_get.return_value.headers = {}
+        self.assertEqual(
+            main.get_data("test_api_key", "lat", "lon", "de"), {"test": "data"}
+        )
+        self.assertEqual(
+            mock_get.call_args.kwargs["headers"], {"If-Modified-Since": last_modified}
+        )
+
+    @patch("main._get_session")
+    def test_get_data_etag(self, mock_session):
+        """Test whether get_data revalidates an expired response with its ETag."""
+        mock_get = mock_session.return_value.get
+        mock_get.return_value.status_code = 200
+        mock_get.return_value.content = b'{"test": "data"}'
+        mock_get.return_value.headers = {
+            "ETag": 'W/"abc"',
+            "Cache-Control": "max-age=0",
+        }
+        main.get_data("test_api_key", "lat", "lon", "de")
+
+        mock_get.return_value.status_code = 304
+        mock_get.return_value.headers = {}
+        self.assertEqual(
+            main.get_data("test_api_key", "lat", "lon", "de"), {"test": "data"}
+        )
+        self.assertEqual(
+            mock_get.call_args.kwargs["headers"], {"If-None-Match": 'W/"abc"'}
+        )
+
+    @patch("main._get_session")
+    def test_get_data_disk_cache(self, mock_session):
+        """Test whether get_data stores responses on disk with the header's max-age."""
+        mock_get = mock_session.return_value.get
         mock_get.return_value.status_code = 200
-        mock_get.return_value.json.return_value = {"test": "data"}
+        mock_get.return_value.content = b'{"test": "data"}'
+        mock_get.return_value.headers = {"Cache-Control": "max-age=300"}
+        disk_cache = main._get_disk_cache.return_value = MagicMock()
+        disk_cache.get.return_value = (None, None)
+        main.get_data("test_api_key", "lat", "lon", "de")
+        disk_cache.set.assert_called_once_with(
+            "lat:lon:de", ({"test": "data"}, {}), expire=300
+        )
+
+        main._WEATHER_CACHE.clear()  # Next run, only the disk cache is filled
+        disk_cache.get.return_value = (({"test": "data"}, {}), time.time() + 300)
+        self.assertEqual(
+            main.get_data("test_api_key", "lat", "lon", "de"), {"test": "data"}
+        )
+        self.assertEqual(mock_get.call_count, 1)
+
+    @patch("main._HTTP_CONNECTION", None)
+    @patch("main._get_session", return_value=None)
+    @patch("http.client.HTTPSConnection")
+    def test_get_data_without_requests(self, mock_connection, mock_session):
+        """Test get_data's http.client fallback when requests is not installed."""
+        response = mock_connection.return_value.getresponse.return_value
+        response.status = 200
+        response.read.return_value = b'{"test": "data"}'
+        self.assertEqual(
+            main.get_data("test_api_key", "lat", "lon", "de"), {"test": "data"}
+        )
+        mock_connection.assert_called_once_with("api.openweathermap.org", timeout=10)
+
+    @patch("main._HTTP_CONNECTION", None)
+    @patch("main._get_session", return_value=None)
+    @patch("http.client.HTTPSConnection")
+    def test_get_data_without_requests_gzip(self, mock_connection, mock_session):
+        """Test whether the http.client fallback asks for and decodes gzip."""
+        response = mock_connection.return_value.getresponse.return_value
+        response.status = 200
+        response.getheader.return_value = "gzip"
+        response.read.return_value = gzip.compress(b'{"test": "data"}')
         self.assertEqual(
             main.get_data("test_api_key", "lat", "lon", "de"), {"test": "data"}
         )
+        request_headers = mock_connection.return_value.request.call_args.kwargs
+        self.assertEqual(request_headers["headers"]["Accept-Encoding"], "gzip")
 
-    @patch("smtplib.SMTP")
+    @patch("socket.getaddrinfo", side_effect=OSError)
+    def test_prewarm_dns(self, mock_getaddrinfo):
+        """Test whether prewarm_dns resolves both servers and ignores lookup errors."""
+        main.prewarm_dns().join()
+        hosts = [call_args[0][:2] for call_args in mock_getaddrinfo.call_args_list]
+        self.assertEqual(
+            hosts, [("api.openweathermap.org", 443), ("smtp.gmail.com", 465)]
+        )
+
+    @patch("main._get_session")
+    def test_get_data_batch(self, mock_session):
+        """Test whether get_data_batch requests at most 20 cities per call."""
+        mock_get = mock_session.return_value.get
+        mock_get.return_value.status_code = 200
+        mock_get.return_value.content = b'{"list": [{"id": 1}]}'
+        result = main.get_data_batch("test_api_key", list(range(45)), "de")
+        self.assertEqual(mock_get.call_count, 3)
+        self.assertEqual(len(result), 3)
+
+    @patch("smtplib.SMTP_SSL")
     def test_send_email(self, mock_smtp):
         """Test send_email function with a successful email send."""
-        data = {
-            "name": "Region",
-            "weather": [{"main": "Clear", "description": "clear sky"}],
-            "main": {"temp": 298},
-        }
         main.send_email(
-            data, "sender@example.com", "receiver@example.com", "password", 5, 20
+            self.data, "sender@example.com", "receiver@example.com", "password", 5, 20
+        )
+        mock_smtp.assert_called_with("smtp.gmail.com", 465, context=ANY)
+
+    @patch("smtplib.SMTP_SSL")
+    def test_send_email_message(self, mock_smtp):
+        """Test whether send_email sends a well-formed HTML message."""
+        main.send_email(
+            self.data, "sender@example.com", "receiver@example.com", "password", 5, 20
+        )
+        raw = mock_smtp.return_value.sendmail.call_args[0][2]
+        msg = email.message_from_bytes(raw, policy=email.policy.default)
+        self.assertTrue(msg["Subject"].startswith("Wetterbericht für Region"))
+        self.assertEqual(msg.get_content_type(), "text/html")
+        self.assertIn("clear sky", msg.get_content())
+
+    @patch("smtplib.SMTP_SSL")
+    def test_send_email_invalid_data(self, mock_smtp):
+        """Test whether send_email rejects an error response before connecting."""
+        data = {"cod": 401, "message": "Invalid API key"}
+        with patch("builtins.print"):
+            result = main.send_email(
+                data, "sender@example.com", "receiver@example.com", "password", 5, 20
+            )
+        self.assertFalse(result)
+        mock_smtp.assert_not_called()
+
+    @patch("smtplib.SMTP_SSL")
+    def test_send_email_today(self, mock_smtp):
+        """Test whether send_email uses a date passed in by the caller."""
+        main.send_email(
+            self.data,
+            "sender@example.com",
+            "receiver@example.com",
+            "password",
+            5,
+            20,
+            today="01.02.03",
+        )
+        raw = mock_smtp.return_value.sendmail.call_args[0][2]
+        msg = email.message_from_bytes(raw, policy=email.policy.default)
+        self.assertEqual(msg["Subject"], "Wetterbericht für Region am 01.02.03")
+
+    @patch("smtplib.SMTP_SSL")
+    def test_send_email_retries_temporary_error(self, mock_smtp):
+        """Test whether a 4xx reply is retried without logging in again."""
+        mock_smtp.return_value.sendmail.side_effect = [
+            smtplib.SMTPDataError(451, b"Try again later"),
+            {},
+        ]
+        result = main.send_email(
+            self.data, "sender@example.com", "receiver@example.com", "password", 5, 20
+        )
+        self.assertTrue(result)
+        self.assertEqual(mock_smtp.return_value.login.call_count, 1)
+        self.assertEqual(mock_smtp.return_value.sendmail.call_count, 2)
+
+    @patch("smtplib.SMTP_SSL")
+    def test_send_email_reconnects_after_421(self, mock_smtp):
+        """Test whether a 421 reply is retried over a new connection."""
+        mock_smtp.return_value.sendmail.side_effect = [
+            smtplib.SMTPSenderRefused(421, b"Closing connection", "sender@example.com"),
+            {},
+        ]
+        result = main.send_email(
+            self.data, "sender@example.com", "receiver@example.com", "password", 5, 20
+        )
+        self.assertTrue(result)
+        self.assertEqual(mock_smtp.call_count, 2)
+        self.assertEqual(mock_smtp.return_value.sendmail.call_count, 2)
+
+    @patch("smtplib.SMTP_SSL")
+    def test_send_email_retries_refused_recipient(self, mock_smtp):
+        """Test whether a temporary 4xx RCPT refusal is retried on the same connection."""
+        mock_smtp.return_value.sendmail.side_effect = [
+            smtplib.SMTPRecipientsRefused({"receiver@example.com": (450, b"Busy")}),
+            {},
+        ]
+        result = main.send_email(
+            self.data, "sender@example.com", "receiver@example.com", "password", 5, 20
+        )
+        self.assertTrue(result)
+        self.assertEqual(mock_smtp.return_value.login.call_count, 1)
+        self.assertEqual(mock_smtp.return_value.sendmail.call_count, 2)
+
+    @patch("smtplib.SMTP_SSL")
+    def test_send_email_receivers(self, mock_smtp):
+        """Test whether every receiver gets its own message over one connection."""
+        receivers = ["a@example.com", "b@example.com"]
+        main.send_email(self.data, "sender@example.com", receivers, "password", 5, 20)
+        self.assertEqual(mock_smtp.call_count, 1)
+        calls = mock_smtp.return_value.sendmail.call_args_list
+        for receiver, sendmail_call in zip(receivers, calls):
+            self.assertEqual(sendmail_call[0][1], [receiver])
+            msg = email.message_from_bytes(sendmail_call[0][2])
+            self.assertEqual(msg["To"], receiver)
+
+    @patch("smtplib.SMTP_SSL")
+    def test_send_email_refused_receiver(self, mock_smtp):
+        """Test whether a refused receiver does not stop the mail to the others."""
+        receivers = ["bad@example.com", "a@example.com", "b@example.com"]
+        mock_smtp.return_value.sendmail.side_effect = [
+            smtplib.SMTPRecipientsRefused({"bad@example.com": (550, b"No such user")}),
+            {},
+            {},
+        ]
+        with patch("builtins.print"):
+            result = main.send_email(
+                self.data, "sender@example.com", receivers, "password", 5, 20
+            )
+        self.assertFalse(result)
+        calls = mock_smtp.return_value.sendmail.call_args_list
+        self.assertEqual(
+            [call_args[0][1] for call_args in calls], [[r] for r in receivers]
+        )
+        self.assertEqual(mock_smtp.call_count, 1)  # The pooled connection is kept
+
+    @patch("smtplib.SMTP_SSL")
+    def test_send_email_no_receivers(self, mock_smtp):
+        """Test whether send_email fails without connecting if no receiver is given."""
+        with patch("builtins.print"):
+            result = main.send_email(
+                self.data, "sender@example.com", [], "password", 5, 20
+            )
+        self.assertFalse(result)
+        mock_smtp.assert_not_called()
+
+    @patch("smtplib.SMTP_SSL")
+    def test_send_email_reuses_connection(self, mock_smtp):
+        """Test whether consecutive send_email calls share one SMTP connection."""
+        for _ in range(2):
+            main.send_email(
+                self.data,
+                "sender@example.com",
+                "receiver@example.com",
+                "password",
+                5,
+                20,
+            )
+        self.assertEqual(mock_smtp.call_count, 1)
+        self.assertEqual(mock_smtp.return_value.sendmail.call_count, 2)
+
+    @patch("smtplib.SMTP_SSL")
+    def test_send_email_with_connection(self, mock_smtp):
+        """Test whether send_email reuses a given SmtpSender and logs in only once."""
+        with main.SmtpSender("sender@example.com", "password") as connection:
+            for receiver in ("a@example.com", "b@example.com"):
+                main.send_email(
+                    self.data,
+                    "sender@example.com",
+                    receiver,
+                    "password",
+                    5,
+                    20,
+                    connection=connection,
+                )
+        mock_smtp.return_value.login.assert_called_once()
+        mock_smtp.return_value.quit.assert_called_once()
+        self.assertEqual(main._SMTP_POOL, {})
+
+    @patch("main.send_email", return_value=True)
+    @patch("main.get_data", return_value={"test": "data"})
+    @patch("main.ConfigManager")
+    def test_run_headless(self, mock_config_manager, mock_get_data, mock_send_email):
+        """Test whether run_headless sends the report with the saved configuration."""
+        mock_config_manager.return_value.load_config.return_value = {
+            "latitude": "1",
+            "longitude": "2",
+            "language": "de",
+            "cold_threshold": 5,
+            "warm_threshold": 20,
+            "sender_email": "sender@example.com",
+            "receiver_email": "a@example.com, b@example.com",
+            "decrypted_password": "password",
+        }
+        self.assertTrue(main.run_headless("test_api_key", "config.ini"))
+        mock_get_data.assert_called_once_with("test_api_key", "1", "2", "de")
+        mock_send_email.assert_called_once_with(
+            {"test": "data"},
+            "sender@example.com",
+            ["a@example.com", "b@example.com"],
+            "password",
+            5,
+            20,
+        )
+
+    @patch("smtplib.SMTP_SSL")
+    def test_send_bulk_single_chunk(self, mock_smtp):
+        """Test whether send_bulk sends a single chunk in-process over one connection."""
+        receivers = ["a@example.com", "b@example.com"]
+        with patch("multiprocessing.Pool") as mock_pool:
+            self.assertTrue(
+                main.send_bulk(
+                    self.data, "sender@example.com", receivers, "password", 5, 20
+                )
+            )
+        mock_pool.assert_not_called()
+        mock_smtp.return_value.login.assert_called_once()
+        self.assertEqual(mock_smtp.return_value.sendmail.call_count, 2)
+
+    @patch("smtplib.SMTP_SSL")
+    def test_send_bulk_reconnects(self, mock_smtp):
+        """Test whether a chunk opens a new connection every SMTP_MAX_MESSAGES mails."""
+        receivers = [f"{number}@example.com" for number in range(12)]
+        self.assertTrue(
+            main.send_bulk(
+                self.data, "sender@example.com", receivers, "password", 5, 20
+            )
+        )
+        self.assertEqual(mock_smtp.call_count, 2)
+        self.assertEqual(mock_smtp.return_value.sendmail.call_count, 12)
+
+    @patch("smtplib.SMTP_SSL")
+    def test_send_bulk_no_receivers(self, mock_smtp):
+        """Test whether send_bulk fails if no receiver is given."""
+        with patch("builtins.print"):
+            self.assertFalse(
+                main.send_bulk(self.data, "sender@example.com", [], "password", 5, 20)
+            )
+        mock_smtp.assert_not_called()
+
+    @patch("multiprocessing.Pool")
+    def test_send_bulk_chunks(self, mock_pool):
+        """Test whether send_bulk gives every worker process one chunk of receivers."""
+        pool = mock_pool.return_value.__enter__.return_value
+        pool.map.return_value = [True, True, True]
+        receivers = [f"{number}@example.com" for number in range(5)]
+        self.assertTrue(
+            main.send_bulk(
+                {}, "sender@example.com", receivers, "password", 5, 20, chunk_size=2
+            )
+        )
+        mock_pool.assert_called_once_with(
+            3, initializer=main._init_bulk_worker, initargs=(3,)
+        )
+        chunks = pool.map.call_args[0][1]
+        self.assertEqual(
+            [chunk[2] for chunk in chunks],
+            [receivers[0:2], receivers[2:4], receivers[4:]],
+        )
+
+    @patch("main.SMTP_RATE_LIMIT", 2)
+    @patch("time.sleep")
+    def test_take_token(self, mock_sleep):
+        """Test whether the token bucket only delays sends beyond the limit."""
+        for _ in range(2):
+            main._take_token("example.com")
+        main._take_token("example.org")  # Every domain has its own bucket
+        mock_sleep.assert_not_called()
+        main._take_token("example.com")
+        self.assertAlmostEqual(mock_sleep.call_args[0][0], 30, places=0)
+
+    @patch("main._RATE_SHARE", 2)
+    @patch("main.SMTP_RATE_LIMIT", 4)
+    @patch("time.sleep")
+    def test_take_token_bulk_worker(self, mock_sleep):
+        """Test whether a send_bulk worker only uses its share of the rate limit."""
+        for _ in range(2):
+            main._take_token("example.com")
+        mock_sleep.assert_not_called()
+        main._take_token("example.com")
+        self.assertAlmostEqual(mock_sleep.call_args[0][0], 30, places=0)
+
+    @patch("smtplib.SMTP_SSL", side_effect=OSError("Network is unreachable"))
+    @patch("main.get_data")
+    @patch("main.ConfigManager")
+    def test_run_headless_network_error(
+        self, mock_config_manager, mock_get_data, mock_smtp
+    ):
+        """Test whether run_headless returns False instead of raising network errors."""
+        mock_config_manager.return_value.load_config.return_value = {
+            "latitude": "1",
+            "longitude": "2",
+            "language": "de",
+            "cold_threshold": 5,
+            "warm_threshold": 20,
+            "sender_email": "sender@example.com",
+            "receiver_email": "receiver@example.com",
+            "decrypted_password": "password",
+        }
+        with patch("builtins.print"):
+            mock_get_data.side_effect = OSError("Name or service not known")
+            self.assertFalse(main.run_headless("test_api_key", "config.ini"))
+
+            mock_get_data.side_effect = None
+            mock_get_data.return_value = self.data
+            self.assertFalse(main.run_headless("test_api_key", "config.ini"))
+        mock_smtp.assert_called_once()
+
+    def test_pipelined_sendmail(self):
+        """Test whether MAIL FROM and RCPT TO are sent in one write when pipelining."""
+        server = MagicMock()
+        server.esmtp_features = {"pipelining": ""}
+        server.getreply.return_value = (250, b"OK")
+        server.data.return_value = (250, b"OK")
+        refused = main._pipelined_sendmail(
+            server, "sender@example.com", ["a@example.com", "b@example.com"], "msg"
+        )
+        self.assertEqual(refused, {})
+        server.send.assert_called_once_with(
+            "mail FROM:<sender@example.com>\r\n"
+            "rcpt TO:<a@example.com>\r\n"
+            "rcpt TO:<b@example.com>\r\n"
+        )
+        self.assertEqual(server.getreply.call_count, 3)
+        server.sendmail.assert_not_called()
+
+    def test_pipelined_sendmail_8bitmime(self):
+        """Test whether BODY=8BITMIME is declared if the server supports it."""
+        server = MagicMock()
+        server.esmtp_features = {"pipelining": "", "8bitmime": ""}
+        server.getreply.return_value = (250, b"OK")
+        server.data.return_value = (250, b"OK")
+        main._pipelined_sendmail(server, "sender@example.com", ["a@example.com"], "msg")
+        server.send.assert_called_once_with(
+            "mail FROM:<sender@example.com> BODY=8BITMIME\r\n"
+            "rcpt TO:<a@example.com>\r\n"
+        )
+
+        server.esmtp_features = {"8bitmime": ""}  # Without pipelining
+        main._pipelined_sendmail(server, "sender@example.com", ["a@example.com"], "msg")
+        server.sendmail.assert_called_once_with(
+            "sender@example.com", ["a@example.com"], "msg", ["BODY=8BITMIME"]
         )
-        mock_smtp.assert_called_with("smtp.gmail.com", 587)
 
     def test_create_default_config(self):
         """Test create_default_config function for creating default config."""
@@ -92,6 +561,31 @@ class test_read(unittest.TestCase):
         for key, value in preset_config.items():
             self.assertEqual(config.get(key, ""), value)
 
+    def test_load_config_cached(self):
+        """Test whether load_config reuses the parsed config until the file changes."""
+        with tempfile.TemporaryDirectory() as tmp:
+            config_manager = main.ConfigManager(os.path.join(tmp, "config.ini"))
+            first = config_manager.load_config()
+            with patch.object(config_manager.config, "read") as mock_read:
+                self.assertEqual(config_manager.load_config(), first)
+                mock_read.assert_not_called()
+            with patch.object(config_manager.config, "read") as mock_read:
+                config_manager.save_config(
+                    "1", "1", "de", "1", "30", "test@gmail.com", "test@gmail.com", "1"
+                )
+                mock_read.assert_not_called()
+            self.assertEqual(config_manager.load_config()["warm_threshold"], 30)
+
+    def test_save_config_unchanged(self):
+        """Test whether save_config skips writing when nothing has changed."""
+        with tempfile.TemporaryDirectory() as tmp:
+            config_manager = main.ConfigManager(os.path.join(tmp, "config.ini"))
+            args = ("1", "1", "de", "1", "30", "test@gmail.com", "test@gmail.com", "1")
+            config_manager.save_config(*args)
+            with patch("main.open", new_callable=mock_open) as mock_file:
+                config_manager.save_config(*args)
+                mock_file.assert_not_called()
+
     @patch(
         "main.open",
         new_callable=mock_open,
@@ -106,6 +600,25 @@ class test_read(unittest.TestCase):
         except ValueError:
             self.fail("function password_key() returns an invalid FernetKey")
 
+    @patch(
+        "main.open",
+        new_callable=mock_open,
+        read_data="GJwdfls_Apgt!FJnKmMV9dmzrMt_10Y4_Qe2HiBEyI6c=",
+    )
+    def test_password_key_invalid(self, mock_file):
+        """Test whether a key with invalid characters is replaced by a new one."""
+        config_manager = main.ConfigManager("config.ini")
+        key = config_manager.generate_password_key()
+        self.assertNotIn(b"!", key)
+        mock_file.assert_any_call("passwordKey.txt", "wb")
+
+    def test_password_cipher_compatible(self):
+        """Test whether PasswordCipher tokens can be decrypted by cryptography's Fernet."""
+        key = Fernet.generate_key()
+        token = main.PasswordCipher(key).encrypt("password123")
+        self.assertEqual(Fernet(key).decrypt(token.encode()).decode(), "password123")
+        self.assertEqual(main.PasswordCipher(key).decrypt(token), "password123")
+
 
 if __name__ == "__main__":
     unittest.main()